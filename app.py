@@ -1,14 +1,28 @@
 import streamlit as st
 import pandas as pd
+import os
 import pickle
+import joblib
 
 # ─────────────────────────────────────────────────────────────
-# Load trained model + encoders
-with open("rf_model.pkl", "rb") as f:
-    model = pickle.load(f)
+# Load trained model + encoders (once per process, not on every rerun)
+@st.cache_resource
+def load_model():
+    # Fall back to the legacy rf_model.pkl for models saved before the joblib switch
+    if not os.path.exists("rf_model.joblib") and os.path.exists("rf_model.pkl"):
+        return joblib.load("rf_model.pkl")
+    return joblib.load("rf_model.joblib")
 
-with open("label_encoders.pkl", "rb") as f:
-    label_encoders = pickle.load(f)
+
+@st.cache_resource
+def load_encoders():
+    with open("label_encoders.pkl", "rb") as f:
+        label_encoders = pickle.load(f)
+    # Plain dict lookups are much cheaper than LabelEncoder.transform for a single row
+    return {
+        col: {cls: i for i, cls in enumerate(le.classes_)}
+        for col, le in label_encoders.items()
+    }
 
 # ─────────────────────────────────────────────────────────────
 # Page configuration
@@ -28,7 +42,7 @@ col1, col2 = st.columns(2, gap="large")
 
 with col1:
     category = st.selectbox("Category", ["Haircare", "Makeup", "Skincare", "Fragrance"])
-    material = st.selectbox("Material", ["Plastic", "Glass", "Aluminium", "Paper"])
+    material = st.selectbox("Material", ["Plastic", "Glass", "Aluminum", "Paper"])
     packaging_type = st.selectbox("Packaging Type", ["Bottle", "Box", "Tube", "Jar"])
     transport_mode = st.selectbox("Transport Mode", ["Road", "Air", "Sea"])
 
@@ -53,10 +67,17 @@ if st.button("🔎 Predict Impact"):
     }
     df_input = pd.DataFrame(input_dict)
 
+    model = load_model()
+    encoders_map = load_encoders()
+
     # Encode categorical features using saved encoders
-    for col, le in label_encoders.items():
+    for col, mapping in encoders_map.items():
         if col in df_input.columns:
-            df_input[col] = le.transform(df_input[col])
+            encoded = df_input[col].map(mapping)
+            if encoded.isna().any():
+                st.error(f"Unknown {col} value: {df_input[col].iloc[0]!r} was not seen during training.")
+                st.stop()
+            df_input[col] = encoded
 
     # Predict (multi-output)
     prediction = model.predict(df_input)[0]